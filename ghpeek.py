@@ -1,16 +1,21 @@
 #!/usr/bin/env python3
 
 import argparse
+import base64
+import hashlib
 import os
-import json
 import re
-import tempfile
-import subprocess
-from collections import OrderedDict
-from datetime import timedelta
+import sys
+import time
+from pathlib import Path
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+import orjson
 import requests
-from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.parser import HTMLParser
 from rich.console import Console
 from rich.table import Table
 from rich.padding import Padding
@@ -19,6 +24,9 @@ from rich.prompt import IntPrompt
 
 console = Console()
 
+# GitHub's username rules: alphanumeric with single inner hyphens, max 39
+_USERNAME_RE = re.compile(r'^[A-Za-z0-9](?:[A-Za-z0-9]|-(?=[A-Za-z0-9])){0,38}$')
+
 API_BASE = "https://api.github.com/users/{}"
 PROFILE_BASE = "https://github.com/{}"
 GRAPHQL_ENDPOINT = "https://api.github.com/graphql"
@@ -30,49 +38,302 @@ TOKEN = os.environ.get("GITHUB_TOKEN")
 if TOKEN:
     HEADERS["Authorization"] = f"token {TOKEN}"
 
+# One session for every GitHub call: keep-alive avoids a fresh TCP+TLS
+# handshake per request, and the adapter retries transient 5xx responses.
+# With requests_cache installed the session also keeps a short-TTL sqlite
+# cache on disk, so re-running ghpeek against the same user within a few
+# minutes is a local read instead of a burst of API calls (and doesn't
+# touch the rate limit). GraphQL POSTs are cached too — the query+vars
+# body is part of the cache key.
+try:
+    from requests_cache import CachedSession
+
+    SESSION = CachedSession(
+        cache_name=os.path.expanduser("~/.cache/ghpeek/http_cache"),
+        backend="sqlite",
+        expire_after=timedelta(minutes=10),
+        allowable_methods=("GET", "POST"),
+        # Revalidate expired entries with If-None-Match: GitHub answers
+        # 304 without a body and without charging the rate limit. Serve
+        # the stale copy if the API errors out instead.
+        cache_control=True,
+        stale_if_error=True,
+        urls_expire_after={
+            "*/events": 60,           # activity feed changes fastest
+            "*/repos*": 300,
+            "api.github.com/graphql": 600,
+            # The profile-HTML scrape deliberately bypasses this cache
+            # (see fetch_contributions_from_profile); its parsed result
+            # is cached on disk separately.
+        },
+    )
+except ImportError:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    # 429 included so secondary-rate-limit responses back off (urllib3
+    # honors Retry-After) instead of surfacing as hard errors
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+)
+# Mounted for all HTTPS hosts so the githubassets CDN (avatars, badges)
+# shares the pool and retry policy with the API endpoints
+SESSION.mount("https://", _adapter)
+
+# Last-seen GitHub rate-limit state, updated from response headers by a
+# session hook so every call site contributes without changes
+_RATE = {"remaining": 5000, "reset": 0.0}
+
+
+def _track_rate_limit(response, *args, **kwargs):
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    if remaining is not None:
+        try:
+            _RATE["remaining"] = int(remaining)
+            _RATE["reset"] = float(response.headers.get("X-RateLimit-Reset", _RATE["reset"]))
+        except ValueError:
+            pass
+
+
+SESSION.hooks["response"].append(_track_rate_limit)
+
+
+def _rate_limit_backoff():
+    """
+    Called before rate-limited API calls: when the remaining quota is
+    nearly gone, wait (capped at 30s) for the reset instead of burning
+    the last requests into a 403 storm.
+    """
+    if _RATE["remaining"] < 100:
+        wait = min(_RATE["reset"] - time.time(), 30)
+        if wait > 0:
+            console.print(f"[yellow]API quota nearly exhausted; backing off {wait:.0f}s[/yellow]")
+            time.sleep(wait)
+
+
+# Single worker pool for every background fetch; the GIL is released
+# during socket reads, so one small shared pool covers all I/O overlap
+# without spawning a fresh executor (and thread stacks) per call site
+_POOL = ThreadPoolExecutor(max_workers=8)
+
 def display_profile_picture(avatar_url, username):
-    """Display profile picture using kitty +kitten icat."""
+    """Display profile picture via the kitty graphics protocol."""
     try:
-        # Download the image to a temporary file
-        response = requests.get(avatar_url, timeout=10)
+        # Asset host; a None value drops the session's Authorization
+        # header so the API token never leaves github's API endpoints
+        response = SESSION.get(avatar_url, timeout=10,
+                               headers={"Authorization": None})
         if response.status_code != 200:
             return False
-            
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp_file:
-            tmp_file.write(response.content)
-            temp_filename = tmp_file.name
-        
-        # Use kitty +kitten icat to display the image
+        content = response.content
+
+        if content.startswith(b'\x89PNG'):
+            # PNG avatars render in-process, skipping the icat kitten's
+            # CPython startup; cells are ~1:2, so 20x10 stays square
+            cols, rows = 20, 10
+            sys.stdout.buffer.write(_kitty_png_escape(content, cols, rows))
+            sys.stdout.buffer.write(b'\n' * rows)
+            sys.stdout.flush()
+            console.print(f"[dim](Profile picture displayed)[/dim]\n")
+            return True
+
+        # Non-PNG formats (some uploaded avatars are JPEG) still go
+        # through icat, which converts them
+        import subprocess
         result = subprocess.run([
-            'kitty', '+kitten', 'icat', 
-            temp_filename
-        ])
-        
-        # Clean up the temporary file
-        os.unlink(temp_filename)
-        
+            'kitty', '+kitten', 'icat',
+            '--stdin=yes'
+        ], input=content)
+
         if result.returncode == 0:
             console.print(f"[dim](Profile picture displayed)[/dim]\n")
             return True
         else:
             console.print("[yellow]Failed to display profile picture[/yellow]\n")
             return False
-        
+
     except Exception as e:
         console.print(f"[yellow]Failed to load profile picture: {e}[/yellow]\n")
         return False
 
 
+def _json(resp):
+    """Decode a response body with orjson (2-5x faster than stdlib json)."""
+    return orjson.loads(resp.content)
+
+
+# GitHub always returns strict ISO-8601 timestamps, so fromisoformat is
+# all that's needed — no general-purpose date grammar
+def _parse_dt(s):
+    return datetime.fromisoformat(s.replace('Z', '+00:00'))
+
+
+def _parse_date(s):
+    return date.fromisoformat(s[:10])
+
+
 def fetch_user_api(username):
     """Fetch basic public user info via GitHub REST API."""
     url = API_BASE.format(username)
-    r = requests.get(url, headers=HEADERS, timeout=15)
+    r = SESSION.get(url, timeout=15)
     if r.status_code == 404:
         return None, f"User '{username}' not found (API)."
     if r.status_code != 200:
         return None, f"API error {r.status_code}: {r.text[:200]}"
-    return r.json(), None
+    return _json(r), None
+
+
+EVERYTHING_QUERY = """
+query($login: String!, $repoCount: Int!) {
+  user(login: $login) {
+    login
+    name
+    bio
+    location
+    avatarUrl
+    url
+    createdAt
+    followers { totalCount }
+    following { totalCount }
+    repositories(first: $repoCount, orderBy: {field: UPDATED_AT, direction: DESC}, ownerAffiliations: OWNER) {
+      totalCount
+      nodes {
+        name
+        description
+        url
+        stargazerCount
+        forkCount
+        updatedAt
+        primaryLanguage { name color }
+      }
+    }
+    pinnedItems(first: 6, types: REPOSITORY) {
+      nodes {
+        ... on Repository {
+          name
+          description
+          url
+          stargazerCount
+          forkCount
+          primaryLanguage { name color }
+        }
+      }
+    }
+    contributionsCollection {
+      contributionCalendar {
+        totalContributions
+        weeks {
+          contributionDays {
+            date
+            contributionCount
+            color
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def fetch_everything(username, repo_count=10):
+    """
+    Fetch profile, repos, pinned repos and contributions in ONE GraphQL
+    round trip instead of 4-5 serial REST calls. Requires GITHUB_TOKEN.
+    Returns (bundle_dict, None) or (None, error_message), where the bundle
+    holds data in the same shapes the display functions already consume.
+    """
+    if not TOKEN:
+        return None, "GITHUB_TOKEN not set; GraphQL requires an auth token."
+
+    _rate_limit_backoff()
+    try:
+        r = SESSION.post(GRAPHQL_ENDPOINT,
+                         json={"query": EVERYTHING_QUERY,
+                               "variables": {"login": username, "repoCount": repo_count}},
+                         timeout=15)
+    except Exception as e:
+        return None, f"Network/GraphQL request error: {e}"
+
+    if r.status_code != 200:
+        return None, f"GraphQL error {r.status_code}: {r.text[:200]}"
+
+    try:
+        data = _json(r)
+    except Exception as e:
+        return None, f"Failed to decode GraphQL JSON: {e}"
+
+    if "errors" in data:
+        return None, f"GraphQL errors: {data['errors']}"
+
+    user = data.get("data", {}).get("user")
+    if not user:
+        return None, f"User '{username}' not found (GraphQL)."
+
+    # Normalize the profile to the REST shape print_profile_card expects
+    profile = {
+        "login": user.get("login", username),
+        "name": user.get("name"),
+        "bio": user.get("bio"),
+        "location": user.get("location"),
+        "avatar_url": user.get("avatarUrl"),
+        "html_url": user.get("url"),
+        "created_at": user.get("createdAt"),
+        "public_repos": user.get("repositories", {}).get("totalCount", 0),
+        "followers": user.get("followers", {}).get("totalCount", 0),
+        "following": user.get("following", {}).get("totalCount", 0),
+    }
+
+    # Normalize repos to the REST shape display_user_repos expects
+    repos = []
+    for node in user.get("repositories", {}).get("nodes", []):
+        lang = node.get("primaryLanguage") or {}
+        repos.append({
+            "name": node.get("name", ""),
+            "description": node.get("description"),
+            "html_url": node.get("url", ""),
+            "stargazers_count": node.get("stargazerCount", 0),
+            "forks_count": node.get("forkCount", 0),
+            "language": lang.get("name", ""),
+            "updated_at": node.get("updatedAt", ""),
+        })
+
+    pinned = user.get("pinnedItems", {}).get("nodes", [])
+
+    calendar = user.get("contributionsCollection", {}).get("contributionCalendar", {})
+    flat = {}
+    for w in calendar.get("weeks", []):
+        for day in w.get("contributionDays", []):
+            try:
+                d = _parse_date(day["date"])
+                flat[d] = int(day.get("contributionCount", 0))
+            except Exception:
+                continue
+    # Weeks arrive in chronological order, so the dict is already ordered
+    contributions = flat
+
+    bundle = {
+        "profile": profile,
+        "repos": repos,
+        "pinned": pinned,
+        "contributions": contributions,
+        "total_contributions": calendar.get("totalContributions", 0),
+    }
+    return bundle, None
+
+
+# O(1) event-type dispatch for fetch_recent_activity; each handler takes
+# the event payload and returns the display message
+_EVENT_HANDLERS = {
+    'CreateEvent': lambda p: f"Created {p.get('ref_type', '')}",
+    'DeleteEvent': lambda p: f"Deleted {p.get('ref_type', '')}",
+    'WatchEvent': lambda p: "Starred repository",
+    'ForkEvent': lambda p: "Forked repository",
+    'IssuesEvent': lambda p: f"{p.get('action', '')} issue",
+    'PullRequestEvent': lambda p: f"{p.get('action', '')} pull request",
+}
+
 
 def fetch_recent_activity(username, count=30):
     """Fetch recent user activity (commits, etc.)."""
@@ -80,17 +341,14 @@ def fetch_recent_activity(username, count=30):
         return None, "GITHUB_TOKEN not set; needed for recent activity."
     
     url = f"https://api.github.com/users/{username}/events"
-    headers = {
-        "Authorization": f"Bearer {TOKEN}",
-        "User-Agent": "ghpeek/1.0"
-    }
-    
+
+    _rate_limit_backoff()
     try:
-        r = requests.get(url, headers=headers, timeout=15)
+        r = SESSION.get(url, timeout=15)
         if r.status_code != 200:
             return None, f"API error {r.status_code}: {r.text[:200]}"
             
-        events = r.json()
+        events = _json(r)
         if not events:
             return None, "No recent activity found."
         
@@ -105,10 +363,9 @@ def fetch_recent_activity(username, count=30):
             date = event.get('created_at', '')
             
             if event_type == 'PushEvent':
+                # Slice up front instead of re-checking the cap per commit
                 commits = event.get('payload', {}).get('commits', [])
-                for commit in commits:
-                    if len(recent_activity) >= count:
-                        break
+                for commit in commits[:count - len(recent_activity)]:
                     recent_activity.append({
                         'type': 'commit',
                         'repo': repo_name,
@@ -117,38 +374,19 @@ def fetch_recent_activity(username, count=30):
                         'url': commit.get('url', ''),
                         'date': date
                     })
-                    
-            elif event_type in ['CreateEvent', 'DeleteEvent', 'WatchEvent', 'ForkEvent', 'IssuesEvent', 'PullRequestEvent']:
+
+            else:
                 # Other notable events
-                if len(recent_activity) >= count:
-                    break
-                    
-                action = event.get('payload', {}).get('action', '')
-                ref_type = event.get('payload', {}).get('ref_type', '')
-                
-                if event_type == 'CreateEvent':
-                    message = f"Created {ref_type}"
-                elif event_type == 'DeleteEvent':
-                    message = f"Deleted {ref_type}"
-                elif event_type == 'WatchEvent':
-                    message = "Starred repository"
-                elif event_type == 'ForkEvent':
-                    message = "Forked repository"
-                elif event_type == 'IssuesEvent':
-                    message = f"{action} issue"
-                elif event_type == 'PullRequestEvent':
-                    message = f"{action} pull request"
-                else:
-                    message = f"{event_type} {action}"
-                
-                recent_activity.append({
-                    'type': event_type.lower(),
-                    'repo': repo_name,
-                    'message': message,
-                    'sha': '',
-                    'url': event.get('repo', {}).get('url', '').replace('api.github.com/repos', 'github.com'),
-                    'date': date
-                })
+                handler = _EVENT_HANDLERS.get(event_type)
+                if handler:
+                    recent_activity.append({
+                        'type': event_type.lower(),
+                        'repo': repo_name,
+                        'message': handler(event.get('payload', {})),
+                        'sha': '',
+                        'url': event.get('repo', {}).get('url', '').replace('api.github.com/repos', 'github.com'),
+                        'date': date
+                    })
         
         if not recent_activity:
             return None, "No recent activity found."
@@ -180,7 +418,7 @@ def display_recent_commits(username, count=10):
         activity_type = item['type']
         repo = item['repo']
         message = item['message'][:47] + "..." if len(item['message']) > 47 else item['message']
-        date = dateparser.parse(item['date']).strftime("%m/%d/%Y") if item['date'] else "Unknown"
+        date = _parse_dt(item['date']).strftime("%m/%d/%Y") if item['date'] else "Unknown"
         
         # Color code the activity type
         if activity_type == 'commit':
@@ -204,17 +442,14 @@ def fetch_user_repos(username, count=30, sort="updated"):
         return None, "GITHUB_TOKEN not set; needed for repositories."
     
     url = f"https://api.github.com/users/{username}/repos?sort={sort}&per_page={count}"
-    headers = {
-        "Authorization": f"Bearer {TOKEN}",
-        "User-Agent": "ghpeek/1.0"
-    }
-    
+
+    _rate_limit_backoff()
     try:
-        r = requests.get(url, headers=headers, timeout=15)
+        r = SESSION.get(url, timeout=15)
         if r.status_code != 200:
             return None, f"API error {r.status_code}: {r.text[:200]}"
             
-        repos = r.json()
+        repos = _json(r)
         if not repos:
             return None, "No repositories found."
             
@@ -224,11 +459,13 @@ def fetch_user_repos(username, count=30, sort="updated"):
         return None, f"Error fetching repositories: {e}"
 
 
-def display_user_repos(username, count=10):
-    repos, err = fetch_user_repos(username, count)
-    if err:
-        console.print(f"[yellow]Repositories: {err}[/yellow]")
-        return
+def display_user_repos(username, count=10, repos=None):
+    if repos is None:
+        repos, err = fetch_user_repos(username, count)
+        if err:
+            console.print(f"[yellow]Repositories: {err}[/yellow]")
+            return
+    repos = repos[:count]
     
     if not repos:
         console.print("[dim]No repositories found.[/dim]")
@@ -244,6 +481,10 @@ def display_user_repos(username, count=10):
     table.add_column("Language", style="blue", width=15)
     table.add_column("Updated", style="dim", width=12)
     
+    total_stars = 0
+    total_forks = 0
+    lang_counts = Counter()
+
     for repo in repos:
         name = repo.get('name', '')
         description = repo.get('description', '') or 'No description'
@@ -252,12 +493,17 @@ def display_user_repos(username, count=10):
         language = repo.get('language', '')
         updated = repo.get('updated_at', '')
         url = repo.get('html_url', '')
+
+        total_stars += stars
+        total_forks += forks
+        if language:
+            lang_counts[language] += 1
         
         # Truncate description if too long
         desc_display = description[:47] + "..." if len(description) > 47 else description
         
         # Format updated date
-        updated_display = dateparser.parse(updated).strftime("%m/%d/%Y") if updated else "Unknown"
+        updated_display = _parse_dt(updated).strftime("%m/%d/%Y") if updated else "Unknown"
         
         # Make repository name clickable, currently not working.
         name_display = f"[link={url}]{name}[/link]"
@@ -273,11 +519,8 @@ def display_user_repos(username, count=10):
     
     console.print(table)
     
-    # Show additional repo stats
-    total_stars = sum(repo.get('stargazers_count', 0) for repo in repos)
-    total_forks = sum(repo.get('forks_count', 0) for repo in repos)
-    languages = [repo.get('language') for repo in repos if repo.get('language')]
-    top_language = max(set(languages), key=languages.count) if languages else "None"
+    # Show additional repo stats (accumulated during the render loop)
+    top_language = lang_counts.most_common(1)[0][0] if lang_counts else "None"
     
     console.print(f"\n[dim]Stats: {total_stars} total stars • {total_forks} total forks • Top language: {top_language}[/dim]")
 
@@ -309,21 +552,15 @@ def fetch_pinned_repos(username):
     
     if not TOKEN:
         return None, "GITHUB_TOKEN not set; needed for pinned repos."
-    
-    headers = {
-        "Authorization": f"Bearer {TOKEN}",
-        "Content-Type": "application/json",
-        "User-Agent": "ghpeek/1.0"
-    }
-    
+
     try:
-        r = requests.post(GRAPHQL_ENDPOINT,
+        r = SESSION.post(GRAPHQL_ENDPOINT,
                          json={"query": query, "variables": {"login": username}},
-                         headers=headers, timeout=15)
+                         timeout=15)
         if r.status_code != 200:
             return None, f"GraphQL error {r.status_code}"
             
-        data = r.json()
+        data = _json(r)
         if "errors" in data:
             return None, f"GraphQL errors: {data['errors']}"
             
@@ -412,18 +649,22 @@ def render_repo_box(repo, use_nerd=False):
         short_lang = lang_name[:8] + "..." if len(lang_name) > 11 else lang_name
         stats_parts.append(f"[{lang_color}]●[/] {short_lang}")
         visible_stats_parts.append(f"● {short_lang}")  
-    visible_stats_text = " · ".join(visible_stats_parts)
     max_stats_chars = box_width - 4
-    
-    # Truncate if too long (using visible length)
+
+    # Shrink by arithmetic on part lengths (" · " separator is 3 chars)
+    # and join once at the end, instead of re-joining and re-measuring the
+    # whole string on every iteration
+    visible_lens = [len(p) for p in visible_stats_parts]
+    visible_width = sum(visible_lens) + 3 * max(len(visible_lens) - 1, 0)
+    while visible_width > max_stats_chars and len(visible_lens) > 1:
+        visible_width -= visible_lens.pop() + 3
+        stats_parts.pop()
+        visible_stats_parts.pop()
+
+    visible_stats_text = " · ".join(visible_stats_parts)
     if len(visible_stats_text) > max_stats_chars:
-        while len(visible_stats_text) > max_stats_chars and len(stats_parts) > 1:
-            stats_parts.pop()
-            visible_stats_parts.pop()
-            visible_stats_text = " · ".join(visible_stats_parts)
-        if len(visible_stats_text) > max_stats_chars:
-            visible_stats_text = visible_stats_text[:max_stats_chars - 1] + "…"
-            stats_parts = [visible_stats_text]
+        visible_stats_text = visible_stats_text[:max_stats_chars - 1] + "…"
+        stats_parts = [visible_stats_text]
     
     stats_text = " · ".join(stats_parts)
     stats_padding = box_width - len(visible_stats_text) - 4
@@ -435,21 +676,50 @@ def render_repo_box(repo, use_nerd=False):
     return box_content
 
 
+# Parsed contribution calendars barely change within a session; persist
+# them per user with a short TTL so re-renders (e.g. menu choice 4 or a
+# quick re-run) skip HTTP entirely
+_CONTRIB_CACHE_DIR = Path(os.path.expanduser("~/.cache/ghpeek/contrib"))
+_CONTRIB_CACHE_TTL = 600  # seconds
+
+
+def _load_cached_contributions(username):
+    path = _CONTRIB_CACHE_DIR / f"{username}.json"
+    try:
+        if time.time() - os.path.getmtime(path) < _CONTRIB_CACHE_TTL:
+            raw = orjson.loads(path.read_bytes())
+            return {date.fromisoformat(k): v for k, v in raw.items()}
+    except Exception:
+        pass
+    return None
+
+
+def _store_cached_contributions(username, date_to_count):
+    try:
+        _CONTRIB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = _CONTRIB_CACHE_DIR / f"{username}.json"
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(orjson.dumps({d.isoformat(): c for d, c in date_to_count.items()}))
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
 def fetch_contributions_graphql(username):
     """
     Fetch contributions via GitHub's GraphQL API.
     Requires GITHUB_TOKEN set (TOKEN variable).
-    Returns (OrderedDict(date->int), None) or (None, error_message).
+    Returns (dict(date->int) in chronological order, None) or
+    (None, error_message).
     """
+    cached = _load_cached_contributions(username)
+    if cached:
+        return cached, None
+
     if not TOKEN:
         return None, "GITHUB_TOKEN not set; GraphQL requires an auth token."
 
-    headers = {
-        "Authorization": f"Bearer {TOKEN}",
-        "Content-Type": "application/json",
-        "User-Agent": "ghpeek/1.0"
-    }
-
+    _rate_limit_backoff()
     query = """
     query($login: String!) {
       user(login: $login) {
@@ -470,9 +740,9 @@ def fetch_contributions_graphql(username):
     """
 
     try:
-        r = requests.post(GRAPHQL_ENDPOINT, 
-                         json={"query": query, "variables": {"login": username}}, 
-                         headers=headers, timeout=15)
+        r = SESSION.post(GRAPHQL_ENDPOINT,
+                         json={"query": query, "variables": {"login": username}},
+                         timeout=15)
     except Exception as e:
         return None, f"Network/GraphQL request error: {e}"
 
@@ -480,7 +750,7 @@ def fetch_contributions_graphql(username):
         return None, f"GraphQL error {r.status_code}: {r.text[:200]}"
 
     try:
-        data = r.json()
+        data = _json(r)
     except Exception as e:
         return None, f"Failed to decode GraphQL JSON: {e}"
 
@@ -501,17 +771,18 @@ def fetch_contributions_graphql(username):
     for w in weeks:
         for day in w.get("contributionDays", []):
             try:
-                d = dateparser.parse(day["date"]).date()
+                d = _parse_date(day["date"])
                 flat[d] = int(day.get("contributionCount", 0))
             except Exception:
                 continue
 
-    ordered = OrderedDict(sorted(flat.items()))
-    if not ordered:
+    # Weeks arrive in chronological order, so the dict is already ordered
+    if not flat:
         return None, "GraphQL: no contribution days parsed."
-    
+
+    _store_cached_contributions(username, flat)
     console.print(f"[dim]Total contributions: {total_contributions}[/dim]")
-    return ordered, None
+    return flat, None
 
 
 def fetch_contributions_from_profile(username):
@@ -519,71 +790,131 @@ def fetch_contributions_from_profile(username):
     Extract contribution data from the GitHub profile page.
     This method looks for the JavaScript data in the page.
     """
+    # With a token the GraphQL API is authoritative and much cheaper than
+    # downloading and scraping the profile page — but only short-circuit
+    # on success, so a bad token or exhausted quota still falls back to
+    # scraping the public page
+    if TOKEN:
+        contributions, _ = fetch_contributions_graphql(username)
+        if contributions:
+            return contributions, None
+
+    cached = _load_cached_contributions(username)
+    if cached:
+        return cached, None
+
     url = PROFILE_BASE.format(username)
+    marker = b'"contributionCalendar"'
+    # CachedSession buffers the whole body before iter_content yields
+    # anything, which would defeat the early termination below, so this
+    # one GET opts out of the HTTP cache via a request header (honored
+    # because cache_control=True) rather than cache_disabled(), which
+    # would race the concurrent _POOL fetches on the shared session.
+    # Warm runs are served by the parsed-contributions cache above.
     try:
-        r = requests.get(url, headers=HEADERS, timeout=15)
+        with SESSION.get(url, stream=True, timeout=15,
+                         headers={"Cache-Control": "no-store"}) as r:
+            if r.status_code == 404:
+                return None, f"Profile for '{username}' not found (404)."
+            if r.status_code != 200:
+                return None, f"Failed to fetch profile ({r.status_code})."
+
+            # The calendar JSON usually sits well before the end of the
+            # page; once it has streamed in, try extracting and stop
+            # downloading the rest on success
+            buf = bytearray()
+            seen_marker = False
+            for chunk in r.iter_content(chunk_size=16384):
+                scan_from = max(len(buf) - len(marker), 0)
+                buf += chunk
+                if not seen_marker:
+                    seen_marker = marker in buf[scan_from:]
+                if seen_marker:
+                    # Only the JSON extractors are safe on a partial page;
+                    # the SVG fallback could succeed on a truncated grid
+                    tree = HTMLParser(buf.decode('utf-8', 'replace'))
+                    contributions = (extract_from_react_data(tree)
+                                     or extract_from_script_tags(tree))
+                    if contributions:
+                        _store_cached_contributions(username, contributions)
+                        return contributions, None
+            html = buf.decode('utf-8', 'replace')
     except Exception as e:
         return None, f"Network error fetching profile: {e}"
 
-    if r.status_code == 404:
-        return None, f"Profile for '{username}' not found (404)."
-    if r.status_code != 200:
-        return None, f"Failed to fetch profile ({r.status_code})."
-
-    return extract_contributions_from_html(r.text)
+    contributions, err = extract_contributions_from_html(html)
+    if contributions:
+        _store_cached_contributions(username, contributions)
+    return contributions, err
 
 
 def extract_contributions_from_html(html):
     """
     Extract contribution data from HTML using multiple methods.
     """
+    # Parse once; all three extractors share the same tree
+    tree = HTMLParser(html)
+
     # Method 1: Look for react data
-    contributions = extract_from_react_data(html)
+    contributions = extract_from_react_data(tree)
     if contributions:
         return contributions, None
 
     # Method 2: Look for JSON in script tags
-    contributions = extract_from_script_tags(html)
+    contributions = extract_from_script_tags(tree)
     if contributions:
         return contributions, None
 
     # Method 3: Try to parse from SVG rectangles (legacy method)
-    contributions = extract_from_svg_rects(html)
+    contributions = extract_from_svg_rects(tree)
     if contributions:
         return contributions, None
 
     return None, "Could not extract contribution data using any method"
 
 
-def extract_from_react_data(html):
+def extract_from_react_data(tree):
     """Extract data from react-app data attribute."""
     try:
         # Look for the react data div
-        soup = BeautifulSoup(html, 'html.parser')
-        react_div = soup.find('div', {'data-target': 'react-app.data'})
-        if react_div and react_div.string:
-            json_data = json.loads(react_div.string)
-            return parse_contributions_from_json_data(json_data)
+        react_div = tree.css_first('div[data-target="react-app.data"]')
+        if react_div:
+            text = react_div.text()
+            if text:
+                json_data = orjson.loads(text)
+                return parse_contributions_from_json_data(json_data)
     except Exception as e:
         pass
     return None
 
 
-def extract_from_script_tags(html):
+# Compiled once; extract_from_script_tags runs these over every <script>
+# tag on the profile page
+_CAL_RE = re.compile(r'(\{.*?"contributionCalendar".*?\})', re.DOTALL)
+_CONTRIB_PATTERNS = [
+    re.compile(r'{"data":\s*(\{.*?"contributionsCollection".*?\})', re.DOTALL),
+    re.compile(r'var\s+data\s*=\s*(\{.*?"contributionsCollection".*?\})', re.DOTALL),
+    re.compile(r'JSON\.parse\s*\(\s*[\'"](.*?)[\'"]\s*\)', re.DOTALL),
+]
+
+
+def extract_from_script_tags(tree):
     """Extract data from JavaScript in script tags."""
     try:
-        soup = BeautifulSoup(html, 'html.parser')
-        scripts = soup.find_all('script')
-        
+        scripts = tree.css('script')
+
         for script in scripts:
-            if script.string:
-                content = script.string
-                
+            content = script.text()
+            if content:
+                # Cheap substring check before any regex work
+                if 'contributionCalendar' not in content and 'contributionsCollection' not in content:
+                    continue
+
                 # Look for JSON data with contribution information
-                json_matches = re.findall(r'(\{.*?"contributionCalendar".*?\})', content, re.DOTALL)
+                json_matches = _CAL_RE.findall(content)
                 for json_str in json_matches:
                     try:
-                        data = json.loads(json_str)
+                        data = orjson.loads(json_str)
                         contributions = parse_contributions_from_json_data(data)
                         if contributions:
                             return contributions
@@ -593,19 +924,13 @@ def extract_from_script_tags(html):
                 # Look for specific GraphQL data
                 if 'contributionsCollection' in content:
                     # Try to extract the data from various patterns
-                    patterns = [
-                        r'{"data":\s*(\{.*?"contributionsCollection".*?\})',
-                        r'var\s+data\s*=\s*(\{.*?"contributionsCollection".*?\})',
-                        r'JSON\.parse\s*\(\s*[\'"](.*?)[\'"]\s*\)',
-                    ]
-                    
-                    for pattern in patterns:
-                        matches = re.findall(pattern, content, re.DOTALL)
+                    for pattern in _CONTRIB_PATTERNS:
+                        matches = pattern.findall(content)
                         for match in matches:
                             try:
                                 # Handle escaped JSON
                                 json_str = match.replace('\\"', '"').replace('\\/', '/')
-                                data = json.loads(json_str)
+                                data = orjson.loads(json_str)
                                 contributions = parse_contributions_from_json_data(data)
                                 if contributions:
                                     return contributions
@@ -617,38 +942,36 @@ def extract_from_script_tags(html):
     return None
 
 
-def extract_from_svg_rects(html):
+def extract_from_svg_rects(tree):
     """Extract data from SVG rectangles (legacy fallback)."""
     try:
-        soup = BeautifulSoup(html, 'html.parser')
-        rects = soup.find_all('rect', {
-            'data-date': True,
-            'data-level': True
-        })
-        
+        rects = tree.css('rect[data-date][data-level]')
+
         if not rects:
             # Try alternative selectors
-            rects = soup.find_all('rect', {'data-date': True})
-        
+            rects = tree.css('rect[data-date]')
+
         flat = {}
         for rect in rects:
             try:
-                date_str = rect.get('data-date')
-                count_str = rect.get('data-count') or '0'
-                
+                attrs = rect.attributes
+                date_str = attrs.get('data-date')
+                count_str = attrs.get('data-count') or '0'
+
                 # If no data-count, try to infer from data-level
                 if count_str == '0':
-                    level = rect.get('data-level', '0')
+                    level = attrs.get('data-level', '0')
                     # Convert level to approximate count
                     level_map = {'1': 1, '2': 5, '3': 10, '4': 20}
                     count_str = str(level_map.get(level, '0'))
                 
-                date_obj = dateparser.parse(date_str).date()
+                date_obj = _parse_date(date_str)
                 flat[date_obj] = int(count_str)
             except Exception:
                 continue
         
-        ordered = OrderedDict(sorted(flat.items()))
+        # Scraped rect order isn't guaranteed, so keep the sort here
+        ordered = dict(sorted(flat.items()))
         return ordered if ordered else None
     except Exception as e:
         return None
@@ -689,16 +1012,16 @@ def parse_contributions_from_json_data(data):
                 count = day.get('contributionCount', 0)
                 if date_str:
                     try:
-                        date_obj = dateparser.parse(date_str).date()
+                        date_obj = _parse_date(date_str)
                         flat[date_obj] = count
                         total_contributions += count
                     except Exception:
                         continue
         
-        ordered = OrderedDict(sorted(flat.items()))
-        if ordered:
+        # Weeks arrive in chronological order, so the dict is already ordered
+        if flat:
             console.print(f"[dim]Total contributions: {total_contributions}[/dim]")
-            return ordered
+            return flat
     except Exception as e:
         pass
         
@@ -706,72 +1029,50 @@ def parse_contributions_from_json_data(data):
 
 
 def build_weeks_matrix(date_to_count, weeks=53):
+    # Deferred: numpy's import cost (~tens of ms) only matters on paths
+    # that never render the graph, e.g. --commits/--repos early exits
+    import numpy as np
+
     if not date_to_count:
         return []
 
     all_dates = list(date_to_count.keys())
-    if not all_dates:
-        return []
-        
     start = all_dates[0]
     end = all_dates[-1]
 
-    # Create a complete date range
-    total_days = (end - start).days + 1
-    full_map = {}
-    for i in range(total_days):
-        d = start + timedelta(days=i)
-        full_map[d] = date_to_count.get(d, 0)
-
-    # Find the first Sunday
-    first_sunday = start
-    while first_sunday.weekday() != 6:  # Sunday=6
-        first_sunday -= timedelta(days=1)
-
-    columns = []
-    cur = first_sunday
-    while cur <= end:
-        col = []
-        for dow in range(7):  # Sunday to Saturday
-            day = cur + timedelta(days=dow)
-            col.append(full_map.get(day, 0))
-        columns.append(col)
-        cur += timedelta(days=7)
-
-    # Trim to requested number of weeks
-    if len(columns) > weeks:
-        columns = columns[-weeks:]
-    elif len(columns) < weeks:
-        # Pad with empty weeks at the beginning
-        pad = weeks - len(columns)
-        columns = [[0]*7 for _ in range(pad)] + columns
-
-    return columns
-
-
-def choose_shade(count, max_count):
-    """Choose intensity based on count."""
-    if count == 0:
-        return 0
-    if max_count == 0:
-        return 1
-    
-    ratio = count / max_count
-    if ratio <= 0.25:
-        return 1
-    if ratio <= 0.5:
-        return 2
-    if ratio <= 0.75:
-        return 3
-    return 4
+    # Align the grid on the Sunday on or before the first date (Sunday=6)
+    first_sunday = start - timedelta(days=(start.weekday() + 1) % 7)
+    n_weeks = (end - first_sunday).days // 7 + 1
+
+    # Scatter counts into a (weeks x 7) grid in one vectorized pass
+    # instead of a day-by-day Python loop
+    grid = np.zeros((n_weeks, 7), dtype=np.int32)
+    dates = np.array(all_dates, dtype='datetime64[D]')
+    counts = np.fromiter(date_to_count.values(), dtype=np.int32, count=len(all_dates))
+    idx = (dates - np.datetime64(first_sunday, 'D')).astype(int)
+    mask = (idx >= 0) & (idx < n_weeks * 7)
+    grid.flat[idx[mask]] = counts[mask]
+
+    # Trim to requested number of weeks, padding at the beginning if short
+    if n_weeks > weeks:
+        grid = grid[-weeks:]
+    elif n_weeks < weeks:
+        grid = np.vstack([np.zeros((weeks - n_weeks, 7), dtype=np.int32), grid])
+
+    return grid
+
 
 def render_contrib_graph(columns, use_nerd=False):
-    if not columns:
+    import numpy as np
+
+    if len(columns) == 0:
         console.print("[yellow]No contribution data to display.[/yellow]")
         return
 
-    all_counts = [count for week in columns for count in week]
-    max_count = max(all_counts) if all_counts else 1
+    # build_weeks_matrix hands its (weeks x 7) array over directly; shade
+    # everything in one vectorized pass instead of a Python loop per cell
+    grid = np.asarray(columns, dtype=np.int32)
+    max_count = int(grid.max()) or 1
 
     dot = "" if use_nerd else ""
     shades = {
@@ -783,15 +1084,15 @@ def render_contrib_graph(columns, use_nerd=False):
         4: (dot, "#216e39"),
     }
 
-    rows = []
-    for day in range(7):
-        row = []
-        for week in columns:
-            count = week[day]
-            shade = choose_shade(count, max_count)
-            char, color = shades[shade]
-            row.append(f"[{color}]{char}[/]")
-        rows.append(" ".join(row))
+    # Only 5 distinct cell strings exist; format them once, not per cell
+    rendered = np.array([f"[{color}]{char}[/]" for char, color in shades.values()])
+
+    # max_count is fixed for the whole render, so the shade boundaries are
+    # computed once; right=True matches bisect_left's boundary handling
+    thresholds = [max_count * 0.25, max_count * 0.5, max_count * 0.75]
+    shade_grid = np.where(grid > 0, 1 + np.digitize(grid, thresholds, right=True), 0)
+
+    rows = [" ".join(rendered[shade_grid[:, day]]) for day in range(7)]
 
     console.print("\n[bold]Contribution Graph[/bold]")
     console.print("[dim](Most recent on the right)[/dim]\n")
@@ -825,7 +1126,7 @@ def print_profile_card(user_json, args):
     
     if created_at:
         try:
-            created = dateparser.parse(created_at).strftime("%b %d, %Y")
+            created = _parse_dt(created_at).strftime("%b %d, %Y")
         except Exception:
             created = created_at
     else:
@@ -843,11 +1144,12 @@ def print_profile_card(user_json, args):
 
     console.print(Padding(table, (0, 0, 1, 0)))
 
-def display_pinned_repos(username, use_nerd=False):
-    pinned_repos, err = fetch_pinned_repos(username)
-    if err:
-        console.print(f"[yellow]Pinned repos: {err}[/yellow]")
-        return
+def display_pinned_repos(username, use_nerd=False, pinned_repos=None):
+    if pinned_repos is None:
+        pinned_repos, err = fetch_pinned_repos(username)
+        if err:
+            console.print(f"[yellow]Pinned repos: {err}[/yellow]")
+            return
     
     if not pinned_repos:
         console.print("[dim]No pinned repositories found.[/dim]")
@@ -862,12 +1164,35 @@ def display_pinned_repos(username, use_nerd=False):
         repo_boxes.append(box)
     
     # Use a simple 2-column layout with equal spacing
-    from rich.columns import Columns
     columns = Columns(repo_boxes, equal=True, column_first=True, expand=True)
     console.print(columns)
 
 
-def show_interactive_menu(username, use_nerd=False):
+def _read_key(prompt):
+    """Read a single keypress without waiting for Enter."""
+    console.print(prompt, end="")
+    try:
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            ch = sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old)
+    except Exception:
+        try:
+            import msvcrt
+            ch = msvcrt.getwch()
+        except Exception:
+            # Not a terminal (piped input, tests): fall back to a line read
+            ch = (input() or "")[:1]
+    console.print(ch)
+    return ch
+
+
+def show_interactive_menu(username, use_nerd=False, bundle=None):
     console.print("\n[bold cyan]Additional Options:[/bold cyan]")
     # console.print("[dim]1.[/dim] View recent commits")
     console.print("[dim]1.[/dim] View recent activities")
@@ -878,20 +1203,29 @@ def show_interactive_menu(username, use_nerd=False):
     
     while True:
         try:
-            choice = IntPrompt.ask("\n[bold]Enter your choice[/bold]", choices=["1", "2", "3", "4", "5"], default=5)
-            
+            # One raw keypress dispatches immediately; no Enter required
+            key = _read_key("\n[bold]Enter your choice (1-5):[/bold] ")
+            choice = int(key) if key and key in "12345" else 5
+
+
             if choice == 1:
                 count = IntPrompt.ask("How many recent commits to show?", default=10)
                 display_recent_commits(username, count)
             elif choice == 2:
-                display_pinned_repos(username, use_nerd)
+                display_pinned_repos(username, use_nerd,
+                                     pinned_repos=bundle["pinned"] if bundle else None)
             elif choice == 3:
                 count = IntPrompt.ask("How many repositories to show?", default=10)
-                display_user_repos(username, count)
+                display_user_repos(username, count,
+                                   repos=bundle["repos"] if bundle and len(bundle["repos"]) >= count else None)
             elif choice == 4:
 
-                # Re-fetch and display contributions
-                date_to_count, err = fetch_contributions_graphql(username)
+                # Re-display contributions, reusing the prefetched bundle
+                # when it's available
+                err = None
+                date_to_count = bundle["contributions"] if bundle else None
+                if not date_to_count:
+                    date_to_count, err = fetch_contributions_graphql(username)
                 if not date_to_count:
                     date_to_count, err = fetch_contributions_from_profile(username)
                 if date_to_count:
@@ -909,61 +1243,129 @@ def show_interactive_menu(username, use_nerd=False):
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
 
+def _kitty_png_escape(png_bytes, cols, rows):
+    """
+    Kitty graphics-protocol APC sequences that draw a PNG at the cursor,
+    scaled to cols x rows cells. Writing these directly avoids spawning a
+    `kitty +kitten icat` subprocess (a full CPython boot) per image.
+    """
+    payload = base64.standard_b64encode(png_bytes)
+    parts = []
+    first = True
+    while payload:
+        chunk, payload = payload[:4096], payload[4096:]
+        m = b'1' if payload else b'0'
+        if first:
+            head = b'\x1b_Ga=T,f=100,c=%d,r=%d,m=%s;' % (cols, rows, m)
+            first = False
+        else:
+            head = b'\x1b_Gm=%s;' % m
+        parts.append(head + chunk + b'\x1b\\')
+    return b''.join(parts)
+
+
+_BADGE_CACHE_DIR = Path(os.path.expanduser("~/.cache/ghpeek/badges"))
+_BADGE_REFRESH_AFTER = 7 * 24 * 3600  # revalidate cached badges weekly
+
+
+def _badge_cache_path(url):
+    return _BADGE_CACHE_DIR / (hashlib.sha1(url.encode()).hexdigest() + ".png")
+
+
+def _fetch_badge(achievement):
+    """Return the on-disk path of a badge PNG, downloading it on cache miss."""
+    path = _badge_cache_path(achievement["url"])
+    etag_path = path.with_suffix('.etag')
+
+    # githubassets is a public CDN; the None value drops the session's
+    # Authorization header so the API token is never sent there
+    headers = {"Authorization": None}
+    if path.exists():
+        try:
+            if time.time() - os.path.getmtime(path) < _BADGE_REFRESH_AFTER:
+                return path
+        except OSError:
+            return path
+        # Stale copy: revalidate with the stored ETag so the common case
+        # is a bodyless 304 instead of a full re-download
+        try:
+            headers["If-None-Match"] = etag_path.read_text().strip()
+        except OSError:
+            pass
+
+    try:
+        response = SESSION.get(achievement["url"], timeout=10, headers=headers)
+        if response.status_code == 304:
+            path.touch()
+            return path
+        if response.status_code != 200:
+            return path if path.exists() else None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write atomically so a crashed run never leaves a partial PNG
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(response.content)
+        os.replace(tmp, path)
+        etag = response.headers.get("ETag")
+        if etag:
+            etag_path.write_text(etag)
+        return path
+    except Exception:
+        return path if path.exists() else None
+
+
+# GitHub Achievements badge URLs
+ACHIEVEMENTS = [
+    {
+        "name": "Quickdraw",
+        "url": "https://github.githubassets.com/images/modules/profile/achievements/quickdraw-default.png"
+    },
+    {
+        "name": "Starstruck", 
+        "url": "https://github.githubassets.com/images/modules/profile/achievements/starstruck-default.png"
+    },
+    {
+        "name": "Pair Extraordinaire",
+        "url": "https://github.githubassets.com/images/modules/profile/achievements/pair-extraordinaire-default.png"
+    },
+    {
+        "name": "Pull Shark",
+        "url": "https://github.githubassets.com/images/modules/profile/achievements/pull-shark-default.png"
+    },
+    {
+        "name": "Galaxy Brain",
+        "url": "https://github.githubassets.com/images/modules/profile/achievements/galaxy-brain-default.png"
+    },
+    {
+        "name": "YOLO",
+        "url": "https://github.githubassets.com/images/modules/profile/achievements/yolo-default.png"
+    },
+    {
+        "name": "Arctic Code Vault",
+        "url": "https://github.githubassets.com/images/modules/profile/achievements/arctic-code-vault-contributor-default.png"
+    },
+    {
+        "name": "Public Donation",
+        "url": "https://github.githubassets.com/images/modules/profile/achievements/public-sponsor-default.png"
+    }
+]
+
+
+def _prefetch_badges():
+    """Warm the badge cache; used to overlap downloads with rendering."""
+    list(_POOL.map(_fetch_badge, ACHIEVEMENTS))
+
+
 def display_achievement_badges(username):
-    # GitHub Achievements badge URLs
-    achievements = [
-        {
-            "name": "Quickdraw",
-            "url": "https://github.githubassets.com/images/modules/profile/achievements/quickdraw-default.png"
-        },
-        {
-            "name": "Starstruck", 
-            "url": "https://github.githubassets.com/images/modules/profile/achievements/starstruck-default.png"
-        },
-        {
-            "name": "Pair Extraordinaire",
-            "url": "https://github.githubassets.com/images/modules/profile/achievements/pair-extraordinaire-default.png"
-        },
-        {
-            "name": "Pull Shark",
-            "url": "https://github.githubassets.com/images/modules/profile/achievements/pull-shark-default.png"
-        },
-        {
-            "name": "Galaxy Brain",
-            "url": "https://github.githubassets.com/images/modules/profile/achievements/galaxy-brain-default.png"
-        },
-        {
-            "name": "YOLO",
-            "url": "https://github.githubassets.com/images/modules/profile/achievements/yolo-default.png"
-        },
-        {
-            "name": "Arctic Code Vault",
-            "url": "https://github.githubassets.com/images/modules/profile/achievements/arctic-code-vault-contributor-default.png"
-        },
-        {
-            "name": "Public Donation",
-            "url": "https://github.githubassets.com/images/modules/profile/achievements/public-sponsor-default.png"
-        }
-    ]
-    
     console.print("\n[bold]GitHub Achievements[/bold]\n")
-    
+
     successful_badges = 0
-    temp_files = []
-    
     try:
-        # download all badges
-        for achievement in achievements:
-            try:
-                response = requests.get(achievement["url"], timeout=10)
-                if response.status_code == 200:
-                    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                        tmp_file.write(response.content)
-                        temp_files.append(tmp_file.name)
-                    successful_badges += 1
-            except Exception:
-                continue
-        
+        # Badges are static CDN assets; cached ones skip the network and
+        # the misses download in parallel over the session's pool
+        badge_paths = [p for p in _POOL.map(_fetch_badge, ACHIEVEMENTS)
+                       if p is not None]
+        successful_badges = len(badge_paths)
+
         if successful_badges == 0:
             console.print("[dim]No achievement badges could be loaded[/dim]")
             return
@@ -977,28 +1379,24 @@ def display_achievement_badges(username):
         # Then calculate Y position to be below the current content
         console.print()  # Add some spacing first
         
-        # Display badges in a horizontal row
-        for i, temp_filename in enumerate(temp_files):
+        # Display badges in a horizontal row, batching every escape
+        # sequence into one terminal write instead of spawning an icat
+        # subprocess per badge
+        out = bytearray()
+        for i, badge_path in enumerate(badge_paths):
             x_position = i * (badge_width + spacing)
             # Whatever whatever
             y_position = 40  # Start 10 lines down from current position
-            result = subprocess.run([
-                'kitty', '+kitten', 'icat',
-                '--place', f'{badge_width}x{badge_height}@{x_position}x{y_position}',
-                temp_filename
-            ])
-        
+            out += b'\x1b[s'  # save cursor
+            out += f'\x1b[{y_position + 1};{x_position + 1}H'.encode()
+            out += _kitty_png_escape(badge_path.read_bytes(), badge_width, badge_height)
+            out += b'\x1b[u'  # restore cursor
+        sys.stdout.buffer.write(out)
+        sys.stdout.flush()
+
     except Exception as e:
         console.print(f"[yellow]Error displaying badges: {e}[/yellow]")
-    
-    finally:
-        # Clean up all temporary files
-        for temp_file in temp_files:
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
-    
+
     # Add more spacing after badges to ensure pinned repos appear below them
     console.print("\n\n")
     console.print(f"[dim]Displayed {successful_badges} achievement badges[/dim]")
@@ -1019,13 +1417,42 @@ def main():
     args = parser.parse_args()
     username = args.username.strip()
 
+    # Reject impossible usernames locally instead of paying a round trip
+    # for a guaranteed 404
+    if not _USERNAME_RE.match(username):
+        console.print(f"[red]Invalid GitHub username:[/red] '{username}'")
+        sys.exit(2)
+
     console.print(f"[bold]GitHub Profile Preview[/bold] — [green]{username}[/green]\n")
 
-    # Fetch basic profile info
-    user_json, err = fetch_user_api(username)
-    if err:
-        console.print(f"[yellow]API warning:[/yellow] {err}")
-        user_json = {"login": username, "html_url": f"https://github.com/{username}"}
+    # Start warming the badge cache now so the PNGs are resident by the
+    # time the contribution graph has rendered
+    badge_prefetch = None
+    if not (args.no_badges or args.commits or args.repos):
+        badge_prefetch = _POOL.submit(_prefetch_badges)
+
+    # One GraphQL round trip covers profile, repos, pinned and contributions.
+    # REST remains the fallback for the unauthenticated path.
+    bundle = None
+    if TOKEN and not args.no_graphql:
+        bundle, err = fetch_everything(username)
+        if err:
+            console.print(f"[yellow]GraphQL warning:[/yellow] {err}")
+
+    # Without a token the REST profile call and the profile-page scrape are
+    # independent round trips; run them concurrently so the wait is the
+    # slower of the two rather than their sum.
+    contrib_fut = None
+    if bundle:
+        user_json = bundle["profile"]
+    else:
+        user_fut = _POOL.submit(fetch_user_api, username)
+        if not (args.commits or args.repos):
+            contrib_fut = _POOL.submit(fetch_contributions_from_profile, username)
+        user_json, err = user_fut.result()
+        if err:
+            console.print(f"[yellow]API warning:[/yellow] {err}")
+            user_json = {"login": username, "html_url": f"https://github.com/{username}"}
 
     print_profile_card(user_json, args)
 
@@ -1036,25 +1463,28 @@ def main():
 
     # Show repositories if requested
     if args.repos:
-        display_user_repos(username, args.repos)
+        display_user_repos(username, args.repos,
+                           repos=bundle["repos"] if bundle and len(bundle["repos"]) >= args.repos else None)
         return
 
     # Try different methods to get contribution data
     date_to_count = None
     method_used = ""
-    
-    # Method 1: GraphQL
-    if TOKEN and not args.no_graphql:
-        # console.print("[dim]Trying GraphQL API...[/dim]")
-        date_to_count, err = fetch_contributions_graphql(username)
-        if date_to_count:
-            method_used = "GraphQL API"
-            console.print("[green]✓[/green] Successfully fetched via GraphQL")
+
+    # Method 1: GraphQL (already fetched as part of the bundle)
+    if bundle and bundle["contributions"]:
+        date_to_count = bundle["contributions"]
+        console.print(f"[dim]Total contributions: {bundle['total_contributions']}[/dim]")
+        method_used = "GraphQL API"
+        console.print("[green]✓[/green] Successfully fetched via GraphQL")
 
     # Method 2: Profile page data extraction
     if not date_to_count:
         console.print("[dim]Trying profile data extraction...[/dim]")
-        date_to_count, err = fetch_contributions_from_profile(username)
+        if contrib_fut is not None:
+            date_to_count, err = contrib_fut.result()
+        else:
+            date_to_count, err = fetch_contributions_from_profile(username)
         if date_to_count:
             method_used = "profile data extraction"
             console.print("[green]✓[/green] Successfully extracted from profile")
@@ -1067,6 +1497,9 @@ def main():
             console.print(f"[dim]Data fetched via: {method_used}[/dim]")
         
         if not args.no_badges:
+            # Join the prefetch so the display pass below is pure cache hits
+            if badge_prefetch is not None:
+                badge_prefetch.result()
             display_achievement_badges(username)
     else:
         console.print(f"[red]Failed to fetch contribution data:[/red] {err}")
@@ -1076,10 +1509,11 @@ def main():
         console.print("[dim]• GitHub might have changed their data structure again[/dim]")
 
     if not args.no_pinned:
-        display_pinned_repos(username, use_nerd=args.nerd)
+        display_pinned_repos(username, use_nerd=args.nerd,
+                             pinned_repos=bundle["pinned"] if bundle else None)
 
     if not args.no_interactive:
-        show_interactive_menu(username, use_nerd=args.nerd)
+        show_interactive_menu(username, use_nerd=args.nerd, bundle=bundle)
 
 if __name__ == "__main__":
     main()